@@ -0,0 +1,85 @@
+import glob
+import statistics
+import time
+
+import cv2
+
+import logic_ocr
+
+# Compares per-image preprocess_image against preprocess_images on the
+# sample labels in images/, then breaks the pipeline down per stage.
+
+REPEATS = 3
+
+paths = sorted(glob.glob("images/*.jp*g"))
+
+def median_time(fn):
+    runs = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - start)
+    return statistics.median(runs), min(runs)
+
+def report(label, fn):
+    median, fastest = median_time(fn)
+    print(f"{label.ljust(24)} | median {median:7.3f}s | min {fastest:7.3f}s | {len(paths) / median:6.2f} img/s")
+    return median
+
+def per_image():
+    for path in paths:
+        logic_ocr.preprocess_image(path)
+
+def batched(use_opencl):
+    def run():
+        frames = [cv2.imread(path) for path in paths]
+        logic_ocr.preprocess_images(frames, use_opencl=use_opencl)
+    return run
+
+def stage_breakdown():
+    # Same steps as logic_ocr.preprocess_frame, timed one by one
+    stages = {"read": [], "resize": [], "gray": [], "denoise": [], "threshold": []}
+    for _ in range(REPEATS):
+        totals = dict.fromkeys(stages, 0.0)
+        for path in paths:
+            t = time.perf_counter()
+            img = cv2.imread(path)
+            totals["read"] += time.perf_counter() - t
+
+            t = time.perf_counter()
+            img = cv2.resize(img, None, fx=2.0, fy=2.0, interpolation=cv2.INTER_CUBIC)
+            totals["resize"] += time.perf_counter() - t
+
+            t = time.perf_counter()
+            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+            totals["gray"] += time.perf_counter() - t
+
+            t = time.perf_counter()
+            gray = cv2.fastNlMeansDenoising(gray, None, 10, 7, 21)
+            totals["denoise"] += time.perf_counter() - t
+
+            t = time.perf_counter()
+            cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 21, 10)
+            totals["threshold"] += time.perf_counter() - t
+        for stage, seconds in totals.items():
+            stages[stage].append(seconds)
+
+    print(" | ".join(f"{stage} {statistics.median(runs):.3f}s" for stage, runs in stages.items()))
+
+print("=" * 60)
+print(f"⏱️  PREPROCESSING BENCHMARK ({len(paths)} images, {REPEATS} runs)")
+print("=" * 60)
+
+base = report("per-image", per_image)
+batch_time = report("preprocess_images", batched(False))
+print(f"   median ratio: {base / batch_time:.2f}x")
+
+if cv2.ocl.haveOpenCL():
+    batched(True)()  # warm-up (OpenCL kernel compilation)
+    ocl_time = report("preprocess_images (UMat)", batched(True))
+    print(f"   median ratio: {base / ocl_time:.2f}x")
+else:
+    print("⚪ OpenCL not available, skipping UMat run")
+
+print("\nPer-stage medians (per-image pipeline):")
+stage_breakdown()
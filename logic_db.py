@@ -19,24 +19,75 @@ def init_db():
             sender_name TEXT,
             carrier TEXT,
             status TEXT DEFAULT 'RECEIVED',
-            created_at DATETIME
+            created_at DATETIME,
+            parser_version INTEGER DEFAULT 0,
+            manually_edited INTEGER DEFAULT 0
         )
     ''')
+
+    # Older databases were created before these columns existed
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(packages)")}
+    if "parser_version" not in columns:
+        cursor.execute("ALTER TABLE packages ADD COLUMN parser_version INTEGER DEFAULT 0")
+    if "manually_edited" not in columns:
+        cursor.execute("ALTER TABLE packages ADD COLUMN manually_edited INTEGER DEFAULT 0")
+
+    # Never used by the re-parse query (it seeks on the primary key), only slowed down updates
+    cursor.execute("DROP INDEX IF EXISTS idx_packages_parser_version")
     conn.commit()
     conn.close()
     print(f"[DB] Database initialized: {DB_NAME}")
 
-def insert_package(image_path, raw_ocr_text, tracking_code, recipient_name, sender, carrier):
+def insert_package(image_path, raw_ocr_text, tracking_code, recipient_name, sender, carrier, parser_version, manually_edited=False):
     """
     Inserts a new package record into the database.
+    parser_version records which parser produced the fields (see logic_ocr.PARSER_VERSION).
+    manually_edited marks fields corrected by hand in the form; those rows
+    are never overwritten by reparse_packages.py.
     """
     conn = sqlite3.connect(DB_NAME)
     cursor = conn.cursor()
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     cursor.execute('''
-        INSERT INTO packages (image_path, raw_ocr_text, tracking_code, recipient_name, sender_name, carrier, created_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    ''', (image_path, raw_ocr_text, tracking_code, recipient_name, carrier, timestamp))
+        INSERT INTO packages (image_path, raw_ocr_text, tracking_code, recipient_name, sender_name, carrier, created_at, parser_version, manually_edited)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', (image_path, raw_ocr_text, tracking_code, recipient_name, sender, carrier, timestamp, parser_version, int(manually_edited)))
     conn.commit()
     conn.close()
-    print(f"[DB] Package saved: {tracking_code} for {recipient_name}")
\ No newline at end of file
+    print(f"[DB] Package saved: {tracking_code} for {recipient_name}")
+
+def fetch_stale_batch(conn, parser_version, after_id, batch_size):
+    """
+    Returns the next batch of rows parsed by an older parser, ordered by id.
+    Manually edited rows are skipped.
+    Uses keyset pagination (id > after_id) so each batch is a primary-key
+    seek instead of an OFFSET scan, and the job can resume from any id.
+    """
+    cursor = conn.execute('''
+        SELECT id, raw_ocr_text, tracking_code, recipient_name, sender_name, carrier
+        FROM packages
+        WHERE parser_version < ? AND manually_edited = 0 AND id > ?
+        ORDER BY id
+        LIMIT ?
+    ''', (parser_version, after_id, batch_size))
+    return cursor.fetchall()
+
+def apply_reparse_batch(conn, changed_rows, first_id, last_id, parser_version):
+    """
+    Writes re-parsed fields for rows whose values changed and stamps the
+    whole batch (ids first_id..last_id) with the new parser_version in a
+    single transaction. Rows flagged as manually edited or already stamped
+    since they were fetched are left alone.
+    changed_rows: list of (tracking_code, recipient_name, sender_name, carrier, id)
+    """
+    with conn:
+        if changed_rows:
+            conn.executemany('''
+                UPDATE packages
+                SET tracking_code = ?, recipient_name = ?, sender_name = ?, carrier = ?
+                WHERE id = ? AND parser_version < ? AND manually_edited = 0
+            ''', [(*row, parser_version) for row in changed_rows])
+        conn.execute('''
+            UPDATE packages SET parser_version = ?
+            WHERE id BETWEEN ? AND ? AND parser_version < ? AND manually_edited = 0
+        ''', (parser_version, first_id, last_id, parser_version))
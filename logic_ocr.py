@@ -8,15 +8,15 @@ pytesseract.pytesseract.tesseract_cmd = str(
     Path("C:/Users/dacio.bezerra/AppData/Local/Programs/Tesseract-OCR/tesseract.exe")
 )
 
+# Bump whenever parse_fields_strategy_a changes its output so that
+# reparse_packages.py picks up records parsed by the older rules.
+PARSER_VERSION = 1
+
 # =========================================================
 # IMAGE PREPROCESSING
 # =========================================================
 
-def preprocess_image(image_path: str):
-    img = cv2.imread(image_path)
-    if img is None:
-        return None
-
+def preprocess_frame(img):
     # Upscale for better text resolution
     img = cv2.resize(img, None, fx=2.0, fy=2.0, interpolation=cv2.INTER_CUBIC)
 
@@ -33,6 +33,60 @@ def preprocess_image(image_path: str):
 
     return thresh
 
+def preprocess_image(image_path: str):
+    img = cv2.imread(image_path)
+    if img is None:
+        return None
+
+    return preprocess_frame(img)
+
+def _enable_cpu_opencl() -> bool:
+    """
+    Turns on OpenCV's transparent API if the OpenCL device is a CPU.
+    Callers restore cv2.ocl.useOpenCL() afterwards. OPENCV_OPENCL_DEVICE is only read when OpenCV first creates its OpenCL
+    context, so the CPU default only applies if nothing used OpenCL before.
+    """
+    os.environ.setdefault("OPENCV_OPENCL_DEVICE", ":CPU:")
+    if not cv2.ocl.haveOpenCL():
+        return False
+    cv2.ocl.setUseOpenCL(True)
+    return cv2.ocl.Device.getDefault().type() == cv2.ocl.Device_TYPE_CPU
+
+def preprocess_images(frames, use_opencl=False):
+    """
+    Runs preprocess_frame over several already-loaded frames (folder
+    ingest, multi-crop OCR, re-shoots). Returns a list aligned with
+    frames, with None where a frame was None (e.g. a failed cv2.imread).
+
+    use_opencl=True sends frames through cv2.UMat on a CPU OpenCL device,
+    falling back to plain NumPy when there is none. It is off by default:
+    OpenCV's OpenCL denoiser is a different implementation and has not
+    been checked against preprocess_image output yet.
+    """
+    previous_opencl = cv2.ocl.useOpenCL()
+    use_opencl = use_opencl and _enable_cpu_opencl()
+
+    results = []
+    try:
+        for frame in frames:
+            if frame is None:
+                results.append(None)
+                continue
+
+            if frame.ndim == 2:
+                frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+            elif frame.shape[2] == 4:
+                frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+
+            if use_opencl:
+                results.append(preprocess_frame(cv2.UMat(frame)).get())
+            else:
+                results.append(preprocess_frame(frame))
+    finally:
+        cv2.ocl.setUseOpenCL(previous_opencl)
+
+    return results
+
 def extract_text(image_path: str) -> str:
     if not os.path.exists(image_path):
         return ""
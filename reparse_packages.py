@@ -0,0 +1,86 @@
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import logic_db
+import logic_ocr
+
+# Stored fields compared against a fresh parse of raw_ocr_text
+FIELD_MAP = [
+    ("tracking", "tracking_code"),
+    ("recipient", "recipient_name"),
+    ("sender", "sender_name"),
+    ("carrier", "carrier"),
+]
+
+BATCH_SIZE = 5000
+
+def reparse_chunk(rows):
+    """
+    Runs in a worker process. Re-parses raw OCR text and returns only the
+    rows whose extracted fields differ from what is stored. Manually edited
+    rows never reach this point (see logic_db.fetch_stale_batch).
+    Rows without raw text are skipped: their fields were typed in, and
+    parsing "" would reset them all to DESCONHECIDO.
+    """
+    changed = []
+    for row_id, raw_text, *stored in rows:
+        if not raw_text:
+            continue
+        parsed = logic_ocr.parse_fields_strategy_a(raw_text)
+        fresh = [parsed[key] for key, _ in FIELD_MAP]
+        if fresh != stored:
+            changed.append((*fresh, row_id))
+    return changed
+
+def split(rows, parts):
+    size = max(1, -(-len(rows) // parts))
+    return [rows[i:i + size] for i in range(0, len(rows), size)]
+
+def reparse_all(db_name=logic_db.DB_NAME, batch_size=BATCH_SIZE, workers=None):
+    """
+    Re-parses every package with parser_version < logic_ocr.PARSER_VERSION.
+    Each batch is committed together with its version stamp, so an
+    interrupted run simply resumes from the remaining stale rows.
+
+    Stored fields that differ from the new parser output are overwritten.
+    Rows saved with manually_edited set, or without raw OCR text, keep
+    their fields (the latter are still stamped with the new version).
+    """
+    version = logic_ocr.PARSER_VERSION
+    last_id = 0
+    scanned = 0
+    updated = 0
+    start = time.perf_counter()
+
+    workers = workers or os.cpu_count() or 1
+
+    conn = sqlite3.connect(db_name)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            while True:
+                rows = logic_db.fetch_stale_batch(conn, version, last_id, batch_size)
+                if not rows:
+                    break
+
+                changed = []
+                for part in pool.map(reparse_chunk, split(rows, workers)):
+                    changed.extend(part)
+
+                first_id = rows[0][0]
+                last_id = rows[-1][0]
+                logic_db.apply_reparse_batch(conn, changed, first_id, last_id, version)
+
+                scanned += len(rows)
+                updated += len(changed)
+                print(f"[REPARSE] up to id {last_id}: {scanned} scanned, {updated} updated")
+    finally:
+        conn.close()
+    elapsed = time.perf_counter() - start
+    print(f"[REPARSE] Done (parser v{version}): {scanned} rows in {elapsed:.1f}s, {updated} changed")
+    return scanned, updated
+
+if __name__ == "__main__":
+    logic_db.init_db()
+    reparse_all()